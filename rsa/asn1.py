@@ -17,7 +17,17 @@
 Not all ASN.1-handling code use these definitions, but when it does, they should be here.
 """
 
-from pyasn1.type import univ, namedtype, tag
+import functools
+import typing
+
+from pyasn1.codec.der import decoder
+from pyasn1.error import PyAsn1Error
+from pyasn1.type import base, univ, namedtype, tag
+
+try:
+    from pyasn1_fasder import decode_der as _fasder_decode_der
+except ImportError:
+    _fasder_decode_der = None
 
 
 class PubKeyHeader(univ.Sequence):
@@ -38,6 +48,16 @@ class OpenSSLPubKey(univ.Sequence):
     )
 
 
+class OpenSSLPrivKey(univ.Sequence):
+    """PKCS#8 wrapper around a private key, as written by OpenSSL."""
+
+    componentType = namedtype.NamedTypes(
+        namedtype.NamedType("version", univ.Integer()),
+        namedtype.NamedType("header", PubKeyHeader()),
+        namedtype.NamedType("key", univ.OctetString()),
+    )
+
+
 class AsnPubKey(univ.Sequence):
     """ASN.1 contents of DER encoded public key:
 
@@ -50,3 +70,133 @@ class AsnPubKey(univ.Sequence):
         namedtype.NamedType("modulus", univ.Integer()),
         namedtype.NamedType("publicExponent", univ.Integer()),
     )
+
+
+class AsnPrivKey(univ.Sequence):
+    """ASN.1 contents of DER encoded two-prime private key:
+
+    RSAPrivateKey ::= SEQUENCE {
+        version           Version,
+        modulus           INTEGER,  -- n
+        publicExponent    INTEGER,  -- e
+        privateExponent   INTEGER,  -- d
+        prime1            INTEGER,  -- p
+        prime2            INTEGER,  -- q
+        exponent1         INTEGER,  -- d mod (p-1)
+        exponent2         INTEGER,  -- d mod (q-1)
+        coefficient       INTEGER,  -- (inverse of q) mod p
+    """
+
+    componentType = namedtype.NamedTypes(
+        namedtype.NamedType("version", univ.Integer()),
+        namedtype.NamedType("modulus", univ.Integer()),
+        namedtype.NamedType("publicExponent", univ.Integer()),
+        namedtype.NamedType("privateExponent", univ.Integer()),
+        namedtype.NamedType("prime1", univ.Integer()),
+        namedtype.NamedType("prime2", univ.Integer()),
+        namedtype.NamedType("exponent1", univ.Integer()),
+        namedtype.NamedType("exponent2", univ.Integer()),
+        namedtype.NamedType("coefficient", univ.Integer()),
+    )
+
+
+# The number of additional primes for which the schema classes are kept.
+MAX_OTHER_PRIMES = 16
+
+
+@functools.lru_cache(maxsize=MAX_OTHER_PRIMES)
+def asn_priv_key_type(nr_other_primes: int) -> typing.Type[univ.Sequence]:
+    """Returns the ASN.1 schema class for a private key with additional primes.
+
+    Multi-prime keys store each additional prime as a flat (prime, exponent,
+    coefficient) triple after the coefficient field. The schema classes are
+    cached, so that the most recently used ones are not created again.
+
+    :param nr_other_primes: the number of primes beyond p and q.
+    :return: :py:class:`AsnPrivKey` itself when there are no other primes,
+        or a subclass of it with the additional fields.
+    """
+
+    if not nr_other_primes:
+        return AsnPrivKey
+
+    other_fields = []
+    for i in range(3, nr_other_primes + 3):
+        other_fields.extend(
+            [
+                namedtype.NamedType("prime%d" % i, univ.Integer()),
+                namedtype.NamedType("exponent%d" % i, univ.Integer()),
+                namedtype.NamedType("coefficient%d" % i, univ.Integer()),
+            ]
+        )
+
+    class AsnMultiPrimePrivKey(AsnPrivKey):
+        componentType = namedtype.NamedTypes(*AsnPrivKey.componentType.namedTypes, *other_fields)
+
+    return AsnMultiPrimePrivKey
+
+
+def decode_der(substrate: bytes, asn1Spec: base.Asn1Item) -> typing.Any:
+    """Decodes a DER-encoded substrate according to the given ASN.1 schema.
+
+    When the optional pyasn1-fasder module is installed, its Rust-backed decoder
+    is used. Otherwise, or when pyasn1-fasder rejects the substrate (it is
+    stricter, for example about trailing octets), the pure-Python pyasn1
+    decoder is used.
+
+    :param substrate: the DER-encoded data.
+    :param asn1Spec: ASN.1 schema object, such as ``AsnPubKey()``.
+    :return: the decoded ASN.1 object.
+    :raise pyasn1.error.PyAsn1Error: when the substrate cannot be decoded.
+    """
+
+    if _fasder_decode_der is not None:
+        try:
+            (decoded, _) = _fasder_decode_der(substrate, asn1Spec=asn1Spec)
+            return decoded
+        except PyAsn1Error:
+            pass
+
+    (decoded, _) = decoder.decode(substrate, asn1Spec=asn1Spec)
+    return decoded
+
+
+def count_sequence_components(substrate: bytes) -> typing.Optional[int]:
+    """Counts the components of a DER-encoded SEQUENCE without decoding them.
+
+    Only the tag and length octets are inspected, which makes it cheap to pick
+    a schema, such as the one for a multi-prime private key, before decoding.
+
+    :param substrate: the DER-encoded SEQUENCE.
+    :return: the number of components, or ``None`` when the substrate is not a
+        SEQUENCE with single-octet tags.
+    """
+
+    def read_length(offset: int) -> typing.Tuple[int, int]:
+        length = substrate[offset]
+        offset += 1
+        if length & 0x80:
+            nr_octets = length & 0x7F
+            length = int.from_bytes(substrate[offset : offset + nr_octets], "big")
+            offset += nr_octets
+        return length, offset
+
+    try:
+        if substrate[0] != 0x30:
+            return None
+        (length, offset) = read_length(1)
+        end = offset + length
+
+        count = 0
+        while offset < end:
+            if substrate[offset] & 0x1F == 0x1F:
+                return None
+            (length, offset) = read_length(offset + 1)
+            offset += length
+            count += 1
+    except IndexError:
+        return None
+
+    if offset != end or end > len(substrate):
+        return None
+    return count
@@ -14,8 +14,19 @@
 
 """Common functionality shared by several modules."""
 
+import math
 import typing
 
+# The optional gmpy2 module provides integers backed by the GMP library, which
+# do modular exponentiation several times faster than Python's own integers.
+try:
+    from gmpy2 import mpz as _mpz
+except ImportError:
+    _mpz = None
+
+# Types accepted as integers by the core RSA operations.
+INTEGER_TYPES: typing.Tuple[type, ...] = (int,) if _mpz is None else (int, _mpz)
+
 
 class NotRelativePrimeError(ValueError):
     def __init__(self, a: int, b: int, d: int, msg: str = "") -> None:
@@ -102,6 +113,22 @@ def ceil_div(num: int, div: int) -> int:
     return quanta
 
 
+def fast_int(number: int) -> int:
+    """Returns the number as GMP-backed integer when gmpy2 is installed.
+
+    Without gmpy2 the number is returned as-is. Either way the result behaves
+    like an int, but should only be used internally; convert it back with
+    int() before handing it out.
+
+    >>> fast_int(42) == 42
+    True
+    """
+
+    if _mpz is None:
+        return number
+    return _mpz(number)
+
+
 def extended_gcd(a: int, b: int) -> typing.Tuple[int, int, int]:
     """Returns a tuple (r, i, j) such that r = gcd(a, b) = ia + jb"""
     # r = gcd(a,b) i = multiplicitive inverse of a mod b
@@ -115,8 +142,8 @@ def extended_gcd(a: int, b: int) -> typing.Tuple[int, int, int]:
     oa = a  # Remember original a/b to remove
     ob = b  # negative values from return results
     while b != 0:
-        q = a // b
-        (a, b) = (b, a % b)
+        (q, r) = divmod(a, b)
+        (a, b) = (b, r)
         (x, lx) = ((lx - (q * x)), x)
         (y, ly) = ((ly - (q * y)), y)
     if lx < 0:
@@ -135,12 +162,16 @@ def inverse(x: int, n: int) -> int:
     1
     """
 
-    (divider, inv, _) = extended_gcd(x, n)
+    # pow() also accepts a negative modulus, which extended_gcd() never did.
+    if n < 1:
+        raise NotRelativePrimeError(x, n, extended_gcd(x, n)[0])
 
-    if divider != 1:
-        raise NotRelativePrimeError(x, n, divider)
-
-    return inv
+    # Python 3.8+ computes the modular inverse natively, which is a lot faster
+    # than extended_gcd().
+    try:
+        return pow(x, -1, n)
+    except ValueError as ex:
+        raise NotRelativePrimeError(x, n, math.gcd(x, n)) from ex
 
 
 def crt(a_values: typing.Iterable[int], modulo_values: typing.Iterable[int]) -> int:
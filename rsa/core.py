@@ -20,9 +20,11 @@ mathematically on integers.
 import itertools
 import typing
 
+import rsa.common
+
 
 def assert_int(var: int, name: str) -> None:
-    if isinstance(var, int):
+    if isinstance(var, rsa.common.INTEGER_TYPES):
         return
 
     raise TypeError("{} should be an integer, not {}".format(name, var.__class__))
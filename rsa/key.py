@@ -44,9 +44,14 @@ import rsa.common
 import rsa.randnum
 import rsa.core
 
+if typing.TYPE_CHECKING:
+    import rsa.parallel
+
 
 DEFAULT_EXPONENT = 65537
 
+_UNSUPPORTED_FORMAT_MSG = "Unsupported format: %r, try one of DER, PEM"
+
 
 T = typing.TypeVar("T", bound="AbstractKey")
 
@@ -123,27 +128,11 @@ class AbstractKey(metaclass=abc.ABCMeta):
         :rtype: AbstractKey
         """
 
-        methods = {
-            "PEM": cls._load_pkcs1_pem,
-            "DER": cls._load_pkcs1_der,
-        }
-
-        method = cls._assert_format_exists(format, methods)
-        return method(keyfile)
-
-    @staticmethod
-    def _assert_format_exists(
-        file_format: str, methods: typing.Mapping[str, typing.Callable]
-    ) -> typing.Callable:
-        """Checks whether the given file format exists in 'methods'."""
-
-        try:
-            return methods[file_format]
-        except KeyError as ex:
-            formats = ", ".join(sorted(methods.keys()))
-            raise ValueError(
-                "Unsupported format: %r, try one of %s" % (file_format, formats)
-            ) from ex
+        if format == "PEM":
+            return cls._load_pkcs1_pem(keyfile)
+        if format == "DER":
+            return cls._load_pkcs1_der(keyfile)
+        raise ValueError(_UNSUPPORTED_FORMAT_MSG % (format,))
 
     def save_pkcs1(self, format: str = "PEM") -> bytes:
         """Saves the key in PKCS#1 DER or PEM format.
@@ -154,13 +143,11 @@ class AbstractKey(metaclass=abc.ABCMeta):
         :rtype: bytes
         """
 
-        methods = {
-            "PEM": self._save_pkcs1_pem,
-            "DER": self._save_pkcs1_der,
-        }
-
-        method = self._assert_format_exists(format, methods)
-        return method()
+        if format == "PEM":
+            return self._save_pkcs1_pem()
+        if format == "DER":
+            return self._save_pkcs1_der()
+        raise ValueError(_UNSUPPORTED_FORMAT_MSG % (format,))
 
     def blind(self, message: int) -> typing.Tuple[int, int]:
         """Performs blinding on the message.
@@ -248,7 +235,12 @@ class PublicKey(AbstractKey):
 
     __slots__ = ()
 
+    # Names that are accessible via key['name'].
+    _keys = frozenset(("n", "e"))
+
     def __getitem__(self, key: str) -> int:
+        if key not in self._keys:
+            raise KeyError(key)
         return getattr(self, key)
 
     def __repr__(self) -> str:
@@ -299,11 +291,11 @@ class PublicKey(AbstractKey):
 
         """
 
-        from pyasn1.codec.der import decoder
-        from rsa.asn1 import AsnPubKey
+        from rsa.asn1 import AsnPubKey, decode_der
 
-        (priv, _) = decoder.decode(keyfile, asn1Spec=AsnPubKey())
-        return cls(n=int(priv["modulus"]), e=int(priv["publicExponent"]))
+        priv = decode_der(keyfile, AsnPubKey())
+        # Positional access skips the lookup of the field names.
+        return cls(n=int(priv[0]), e=int(priv[1]))
 
     def _save_pkcs1_der(self) -> bytes:
         """Saves the public key in PKCS#1 DER format.
@@ -317,8 +309,8 @@ class PublicKey(AbstractKey):
 
         # Create the ASN object
         asn_key = AsnPubKey()
-        asn_key.setComponentByName("modulus", self.n)
-        asn_key.setComponentByName("publicExponent", self.e)
+        asn_key["modulus"] = self.n
+        asn_key["publicExponent"] = self.e
 
         return encoder.encode(asn_key)
 
@@ -375,11 +367,10 @@ class PublicKey(AbstractKey):
         :return: a PublicKey object
         """
 
-        from rsa.asn1 import OpenSSLPubKey
-        from pyasn1.codec.der import decoder
+        from rsa.asn1 import OpenSSLPubKey, decode_der
         from pyasn1.type import univ
 
-        (keyinfo, _) = decoder.decode(keyfile, asn1Spec=OpenSSLPubKey())
+        keyinfo = decode_der(keyfile, OpenSSLPubKey())
 
         if keyinfo["header"]["oid"] != univ.ObjectIdentifier("1.2.840.113549.1.1.1"):
             raise TypeError("This is not a DER-encoded OpenSSL-compatible public key")
@@ -413,7 +404,10 @@ class PrivateKey(AbstractKey):
 
     """
 
-    __slots__ = ("d", "p", "q", "exp1", "exp2", "coef", "rs", "ds", "ts")
+    __slots__ = ("d", "p", "q", "exp1", "exp2", "coef", "rs", "ds", "ts", "_crt_params")
+
+    # Names that are accessible via key['name'].
+    _keys = frozenset(("n", "e", "d", "p", "q", "exp1", "exp2", "coef", "rs", "ds", "ts"))
 
     def __init__(
         self,
@@ -432,17 +426,38 @@ class PrivateKey(AbstractKey):
         self.q = q
 
         # Calculate exponents and coefficient.
-        self.exp1 = int(d % (p - 1))
-        self.exp2 = int(d % (q - 1))
+        self.exp1 = d % (p - 1)
+        self.exp2 = d % (q - 1)
         self.coef = rsa.common.inverse(q, p)
 
-        # Calculate other primes' exponents and coefficients.
+        # Calculate other primes' exponents and coefficients. Each coefficient
+        # is the inverse of the product of all preceding primes, so the full
+        # product (which is n) is never needed here.
         self.rs = rs
-        self.ds = [int(d % (r - 1)) for r in rs]
-        Rs = list(itertools.accumulate([p, q] + rs, lambda x, y: x*y))
-        self.ts = [pow(R, -1, r) for R, r in zip(Rs[1:], rs)]
+        self.ds = [d % (r - 1) for r in rs]
+        Rs = itertools.accumulate([p * q] + rs[:-1], lambda x, y: x * y)
+        self.ts = [pow(R, -1, r) for R, r in zip(Rs, rs)]
+
+        self._update_crt_params()
+
+    def _update_crt_params(self) -> None:
+        """Prepares the primes, exponents and coefficients for decryption.
+
+        When gmpy2 is installed these are stored as its GMP-backed integers,
+        which makes decryption several times faster. The public attributes
+        remain plain ints.
+        """
+
+        fast_int = rsa.common.fast_int
+        self._crt_params = (
+            [fast_int(r) for r in [self.p, self.q] + self.rs],
+            [fast_int(d) for d in [self.exp1, self.exp2] + self.ds],
+            [fast_int(t) for t in [self.coef] + self.ts],
+        )
 
     def __getitem__(self, key: str) -> int:
+        if key not in self._keys:
+            raise KeyError(key)
         return getattr(self, key)
 
     def __repr__(self) -> str:
@@ -503,36 +518,34 @@ class PrivateKey(AbstractKey):
             self.n, self.e, self.d, self.p, self.q, self.exp1, self.exp2, self.coef = state
             self.rs = self.ds = self.ts = []
         AbstractKey.__init__(self, self.n, self.e)
+        self._update_crt_params()
 
     def __eq__(self, other: typing.Any) -> bool:
-        if other is None:
-            return False
+        if other is self:
+            return True
 
         if not isinstance(other, PrivateKey):
             return False
 
-        return all([getattr(self, k) == getattr(other, k) for k in self.__slots__])
+        # The exponents and the coefficients are derived from these, so there
+        # is no need to compare them as well. The modulus is compared, as
+        # nothing checks that it matches the primes. The small public exponent
+        # goes first to fail fast.
+        return (
+            self.e == other.e
+            and self.n == other.n
+            and self.p == other.p
+            and self.q == other.q
+            and self.rs == other.rs
+            and self.d == other.d
+        )
 
     def __ne__(self, other: typing.Any) -> bool:
         return not (self == other)
 
     def __hash__(self) -> int:
-        if self.rs:
-            return hash((
-                self.n,
-                self.e,
-                self.d,
-                self.p,
-                self.q,
-                self.exp1,
-                self.exp2,
-                self.coef,
-                *self.rs,
-                *self.ds,
-                *self.ts
-            ))
-        else:
-            return hash((self.n, self.e, self.d, self.p, self.q, self.exp1, self.exp2, self.coef))
+        # Together, n and d identify the key; the other values follow from them.
+        return hash((self.n, self.d))
 
     def blinded_decrypt(self, encrypted: int) -> int:
         """Decrypts the message using blinding to prevent side-channel attacks.
@@ -546,13 +559,8 @@ class PrivateKey(AbstractKey):
 
         # Blinding and un-blinding should be using the same factor
         blinded, blindfac_inverse = self.blind(encrypted)
-        decrypted = rsa.core.decrypt_int_fast(
-            blinded,
-            [self.p, self.q] + self.rs,
-            [self.exp1, self.exp2] + self.ds,
-            [self.coef] + self.ts,
-        )
-        return self.unblind(decrypted, blindfac_inverse)
+        decrypted = rsa.core.decrypt_int_fast(blinded, *self._crt_params)
+        return int(self.unblind(decrypted, blindfac_inverse))
 
     @classmethod
     def _load_pkcs1_der(cls, keyfile: bytes) -> "PrivateKey":
@@ -577,8 +585,27 @@ class PrivateKey(AbstractKey):
         """
 
         from pyasn1.codec.der import decoder
+        from rsa.asn1 import (
+            MAX_OTHER_PRIMES,
+            asn_priv_key_type,
+            count_sequence_components,
+            decode_der,
+        )
 
-        (priv, _) = decoder.decode(keyfile)
+        # Multi-prime keys have three more fields per additional prime, so pick
+        # the matching schema up front instead of retrying after a failure.
+        # The field count comes from the keyfile, so only a bounded number of
+        # schemas is ever built; anything larger is decoded without a schema.
+        nr_fields = count_sequence_components(keyfile)
+        if (
+            nr_fields is not None
+            and nr_fields >= 9
+            and (nr_fields - 9) % 3 == 0
+            and (nr_fields - 9) // 3 <= MAX_OTHER_PRIMES
+        ):
+            priv = decode_der(keyfile, asn_priv_key_type((nr_fields - 9) // 3)())
+        else:
+            (priv, _) = decoder.decode(keyfile)
 
         # ASN.1 contents of DER encoded private key:
         #
@@ -598,8 +625,8 @@ class PrivateKey(AbstractKey):
         if priv[0] != 0:
             raise ValueError("Unable to read this file, version %s != 0" % priv[0])
 
-        n, e, d, p, q = map(int, priv[1:6])
-        exp1, exp2, coef = map(int, priv[6:9])
+        # A single slice is cheaper than indexing the ASN.1 sequence per field.
+        n, e, d, p, q, exp1, exp2, coef = map(int, priv[1:9])
         rs = [int(x) for x in priv[9::3]]
         ds = [int(x) for x in priv[10::3]]
         ts = [int(x) for x in priv[11::3]]
@@ -623,46 +650,24 @@ class PrivateKey(AbstractKey):
         :rtype: bytes
         """
 
-        from pyasn1.type import univ, namedtype
         from pyasn1.codec.der import encoder
-
-        other_fields = [
-            (
-                namedtype.NamedType("prime%d" % (i + 3), univ.Integer()),
-                namedtype.NamedType("exponent%d" % (i + 3), univ.Integer()),
-                namedtype.NamedType("coefficient%d" % (i + 3), univ.Integer()),
-            ) for i in range(len(self.rs))
-        ]
-        
-        class AsnPrivKey(univ.Sequence):
-            componentType = namedtype.NamedTypes(
-                namedtype.NamedType("version", univ.Integer()),
-                namedtype.NamedType("modulus", univ.Integer()),
-                namedtype.NamedType("publicExponent", univ.Integer()),
-                namedtype.NamedType("privateExponent", univ.Integer()),
-                namedtype.NamedType("prime1", univ.Integer()),
-                namedtype.NamedType("prime2", univ.Integer()),
-                namedtype.NamedType("exponent1", univ.Integer()),
-                namedtype.NamedType("exponent2", univ.Integer()),
-                namedtype.NamedType("coefficient", univ.Integer()),
-                *list(itertools.chain(*other_fields))
-            )
+        from rsa.asn1 import asn_priv_key_type
 
         # Create the ASN object
-        asn_key = AsnPrivKey()
-        asn_key.setComponentByName("version", 0)
-        asn_key.setComponentByName("modulus", self.n)
-        asn_key.setComponentByName("publicExponent", self.e)
-        asn_key.setComponentByName("privateExponent", self.d)
-        asn_key.setComponentByName("prime1", self.p)
-        asn_key.setComponentByName("prime2", self.q)
-        asn_key.setComponentByName("exponent1", self.exp1)
-        asn_key.setComponentByName("exponent2", self.exp2)
-        asn_key.setComponentByName("coefficient", self.coef)
+        asn_key = asn_priv_key_type(len(self.rs))()
+        asn_key["version"] = 0
+        asn_key["modulus"] = self.n
+        asn_key["publicExponent"] = self.e
+        asn_key["privateExponent"] = self.d
+        asn_key["prime1"] = self.p
+        asn_key["prime2"] = self.q
+        asn_key["exponent1"] = self.exp1
+        asn_key["exponent2"] = self.exp2
+        asn_key["coefficient"] = self.coef
         for i, (r, d, t) in enumerate(zip(self.rs, self.ds, self.ts), start=3):
-            asn_key.setComponentByName("prime%d" % i, r)
-            asn_key.setComponentByName("exponent%d" % i, d)
-            asn_key.setComponentByName("coefficient%d" % i, t)
+            asn_key["prime%d" % i] = r
+            asn_key["exponent%d" % i] = d
+            asn_key["coefficient%d" % i] = t
 
         return encoder.encode(asn_key)
 
@@ -834,7 +839,9 @@ def calculate_keys_custom_exponent(
             % (exponent, phi_n, ex.d),
         ) from ex
 
-    if (exponent * d) % phi_n != 1:
+    # rsa.common.inverse() guarantees this, so only check it when not running
+    # with optimisations (python -O).
+    if __debug__ and (exponent * d) % phi_n != 1:
         raise ValueError(
             "e (%d) and d (%d) are not mult. inv. modulo " "phi_n (%d)" % (exponent, d, phi_n)
         )
@@ -900,6 +907,8 @@ def newkeys(
     poolsize: int = 1,
     exponent: int = DEFAULT_EXPONENT,
     nprimes: int = 2,
+    use_openssl: bool = False,
+    prime_pool: typing.Optional["rsa.parallel.PrimePool"] = None,
 ) -> typing.Tuple[PublicKey, PrivateKey]:
     """Generates public and private keys, and returns them as (pub, priv).
 
@@ -913,17 +922,24 @@ def newkeys(
         `n`` may have slightly less bits.
     :param poolsize: the number of processes to use to generate the prime
         numbers. If set to a number > 1, a parallel algorithm will be used.
-        This requires Python 2.6 or newer.
     :param exponent: the exponent for the key; only change this if you know
         what you're doing, as the exponent influences how difficult your
         private key can be cracked. A very common choice for e is 65537.
     :type exponent: int
     :param nprimes: the number of prime factors comprising the modulus.
+    :param use_openssl: when True, generate the key with the ``openssl``
+        command line tool, which is much faster. Only two-prime keys of at
+        least 512 bits can be generated this way; ``n`` will always have
+        exactly ``nbits`` bits. When OpenSSL is not available, the key is
+        generated by Python-RSA itself.
+    :param prime_pool: a :py:class:`rsa.parallel.PrimePool` to generate the
+        prime numbers with, instead of starting ``poolsize`` new processes.
+        Keep one pool around when generating many keys, so that its processes
+        are started only once.
 
     :returns: a tuple (:py:class:`rsa.PublicKey`, :py:class:`rsa.PrivateKey`)
 
-    The ``poolsize`` parameter was added in *Python-RSA 3.1* and requires
-    Python 2.6 or newer.
+    The ``poolsize`` parameter was added in *Python-RSA 3.1*.
 
     """
 
@@ -936,18 +952,31 @@ def newkeys(
     if nprimes < 2:
         raise ValueError("Number of primes (%i) should be >= 2" % nprimes)
 
-    # Determine which getprime function to use
-    if poolsize > 1:
-        from rsa import parallel
+    if use_openssl and nprimes == 2:
+        from rsa import openssl
 
-        def getprime_func(nbits: int) -> int:
-            return parallel.getprime(nbits, poolsize=poolsize)
+        if nbits >= openssl.MIN_NBITS:
+            try:
+                priv = openssl.newkey(nbits, exponent)
+            except openssl.OpenSSLError:
+                pass
+            else:
+                return (PublicKey(priv.n, priv.e), priv)
 
-    else:
-        getprime_func = rsa.prime.getprime
+    # The parallel algorithm keeps its processes running until all primes have
+    # been found.
+    if poolsize > 1 and prime_pool is None:
+        from rsa import parallel
+
+        with parallel.PrimePool(poolsize) as pool:
+            return newkeys(
+                nbits, accurate=accurate, exponent=exponent, nprimes=nprimes, prime_pool=pool
+            )
 
     # Generate the key components
+    getprime_func = rsa.prime.getprime if prime_pool is None else prime_pool.getprime
     result = gen_keys(nbits, getprime_func, accurate=accurate, exponent=exponent, nprimes=nprimes)
+
     if len(result) == 4:
         p, q, e, d = result
         rs = []
@@ -964,10 +993,15 @@ __all__ = ["PublicKey", "PrivateKey", "newkeys"]
 
 if __name__ == "__main__":
     import doctest
+    import sys
+
+    # Parse the doctests once, and keep their globals between runs.
+    doctests = doctest.DocTestFinder().find(sys.modules[__name__])
+    runner = doctest.DocTestRunner()
 
     try:
         for count in range(100):
-            (failures, tests) = doctest.testmod()
+            failures = sum(runner.run(test, clear_globs=False).failed for test in doctests)
             if failures:
                 break
 
@@ -0,0 +1,88 @@
+#  Copyright 2011 Sybren A. Stüvel <sybren@stuvel.eu>
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Key generation by the OpenSSL command line tool.
+
+OpenSSL generates keys a lot faster than the pure-Python code in
+:py:mod:`rsa.key`. :py:func:`rsa.newkeys` uses this module when called with
+``use_openssl=True``, and falls back to its own implementation when OpenSSL
+is not available.
+
+Requires the ``openssl`` executable on the ``PATH``.
+"""
+
+import subprocess
+
+import rsa.key
+
+# Smallest modulus OpenSSL is willing to generate.
+MIN_NBITS = 512
+
+
+class OpenSSLError(Exception):
+    """Raised when OpenSSL could not be used to generate a key."""
+
+
+def newkey(nbits: int, exponent: int = rsa.key.DEFAULT_EXPONENT) -> rsa.key.PrivateKey:
+    """Generates a two-prime private key with ``openssl genpkey``.
+
+    :param nbits: the number of bits required to store the modulus ``n``;
+        should be at least :py:data:`MIN_NBITS`.
+    :param exponent: the public exponent for the key.
+    :returns: a :py:class:`rsa.PrivateKey` object.
+    :raise OpenSSLError: when OpenSSL cannot be run, or fails to generate the key.
+    """
+
+    from pyasn1.error import PyAsn1Error
+    from pyasn1.type import univ
+    from rsa.asn1 import OpenSSLPrivKey, decode_der
+
+    cmd = [
+        "openssl",
+        "genpkey",
+        "-algorithm",
+        "RSA",
+        "-outform",
+        "DER",
+        "-pkeyopt",
+        "rsa_keygen_bits:%i" % nbits,
+        "-pkeyopt",
+        "rsa_keygen_pubexp:%i" % exponent,
+    ]
+
+    try:
+        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+    except OSError as ex:
+        raise OpenSSLError("Unable to run OpenSSL: %s" % ex) from ex
+    except subprocess.CalledProcessError as ex:
+        raise OpenSSLError(
+            "OpenSSL failed to generate a key: %s" % ex.stderr.decode("ascii", "replace")
+        ) from ex
+
+    # Depending on its version, OpenSSL writes either the PKCS#1 key itself,
+    # or the PKCS#8 structure wrapping it.
+    der = proc.stdout
+    try:
+        keyinfo = decode_der(der, OpenSSLPrivKey())
+    except PyAsn1Error:
+        pass
+    else:
+        if keyinfo["header"]["oid"] != univ.ObjectIdentifier("1.2.840.113549.1.1.1"):
+            raise OpenSSLError("OpenSSL did not generate an RSA key")
+        der = bytes(keyinfo["key"])
+
+    return rsa.key.PrivateKey._load_pkcs1_der(der)
+
+
+__all__ = ["newkey", "OpenSSLError"]
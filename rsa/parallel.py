@@ -16,13 +16,10 @@
 
 Introduced in Python-RSA 3.1.
 
-.. note::
-
-    Requires Python 2.6 or newer.
-
 """
 
 import multiprocessing as mp
+import typing
 from multiprocessing.connection import Connection
 
 import rsa.prime
@@ -79,14 +76,107 @@ def getprime(nbits: int, poolsize: int) -> int:
     return result
 
 
-__all__ = ["getprime"]
+def _pool_worker(request: typing.Any, working: typing.Any, pipe: Connection) -> None:
+    while True:
+        working.wait()
+
+        with request.get_lock():
+            (request_nr, nbits) = request[:]
+
+        integer = rsa.randnum.read_random_odd_int(nbits)
+
+        # Test for primeness
+        if rsa.prime.is_prime(integer):
+            pipe.send((request_nr, integer))
+
+
+class PrimePool:
+    """Processes that find prime numbers, kept running between requests.
+
+    :py:func:`getprime` starts and stops its processes for every prime. A
+    pool only does this once, which saves the start-up cost when several
+    primes are needed, such as for ``p`` and ``q`` in :py:func:`rsa.newkeys`.
+
+    Use it as a context manager to stop the processes afterwards:
+
+    >>> with PrimePool(3) as pool:
+    ...     p = pool.getprime(128)
+    ...     q = pool.getprime(64)
+    >>> rsa.prime.is_prime(p) and rsa.prime.is_prime(q)
+    True
+
+    >>> from rsa import common
+    >>> common.bit_size(p), common.bit_size(q)
+    (128, 64)
+
+    """
+
+    def __init__(self, poolsize: int) -> None:
+        # The number and bit size of the prime that is currently asked for.
+        self._request = mp.Array("q", 2)
+        self._working = mp.Event()
+        (self._pipe_recv, self._pipe_send) = mp.Pipe(duplex=False)
+
+        self._procs = [
+            mp.Process(
+                target=_pool_worker,
+                args=(self._request, self._working, self._pipe_send),
+                daemon=True,
+            )
+            for _ in range(poolsize)
+        ]
+        for p in self._procs:
+            p.start()
+
+    def getprime(self, nbits: int) -> int:
+        """Returns a prime number that can be stored in 'nbits' bits."""
+
+        with self._request.get_lock():
+            self._request[0] += 1
+            self._request[1] = nbits
+            request_nr = self._request[0]
+
+        self._working.set()
+        try:
+            # Primes found for earlier requests may still be in the pipe.
+            while True:
+                (found_nr, integer) = self._pipe_recv.recv()
+                if found_nr == request_nr:
+                    return integer
+        finally:
+            self._working.clear()
+
+    def close(self) -> None:
+        """Terminates the processes of the pool."""
+
+        for p in self._procs:
+            p.terminate()
+        for p in self._procs:
+            p.join()
+
+        self._pipe_recv.close()
+        self._pipe_send.close()
+
+    def __enter__(self) -> "PrimePool":
+        return self
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        self.close()
+
+
+__all__ = ["getprime", "PrimePool"]
 
 if __name__ == "__main__":
     print("Running doctests 1000x or until failure")
     import doctest
+    import sys
+
+    # Parse the doctests once, and keep their globals between runs.
+    doctests = doctest.DocTestFinder().find(sys.modules[__name__])
+    runner = doctest.DocTestRunner()
 
     for count in range(100):
-        (failures, tests) = doctest.testmod()
+        failures = sum(runner.run(test, clear_globs=False).failed for test in doctests)
         if failures:
             break
 
@@ -15,6 +15,7 @@
 """Functions that load and write PEM-encoded files."""
 
 import base64
+import binascii
 import typing
 
 # Should either be ASCII strings or bytes.
@@ -100,11 +101,10 @@ def load_pem(contents: FlexiText, pem_marker: FlexiText) -> bytes:
         contents = contents.encode("ascii")
 
     (pem_start, pem_end) = _markers(pem_marker)
-    pem_lines = [line for line in _pem_lines(contents, pem_start, pem_end)]
 
-    # Base64-decode the contents
-    pem = b"".join(pem_lines)
-    return base64.standard_b64decode(pem)
+    # Base64-decode the contents, joining the lines straight from the generator.
+    pem = b"".join(_pem_lines(contents, pem_start, pem_end))
+    return binascii.a2b_base64(pem)
 
 
 def save_pem(contents: bytes, pem_marker: FlexiText) -> bytes:
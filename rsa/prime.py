@@ -18,12 +18,39 @@ Implementation based on the book Algorithm Design by Michael T. Goodrich and
 Roberto Tamassia, 2002.
 """
 
+import math
+import typing
+
 import rsa.common
 import rsa.randnum
 
 __all__ = ["getprime", "are_relatively_prime"]
 
 
+def odd_primes_below(limit: int) -> typing.List[int]:
+    """Returns the odd primes below limit, using the sieve of Eratosthenes.
+
+    >>> odd_primes_below(20)
+    [3, 5, 7, 11, 13, 17, 19]
+    """
+
+    sieve = [True] * limit
+    primes = []
+    for i in range(3, limit, 2):
+        if sieve[i]:
+            primes.append(i)
+            for multiple in range(i * i, limit, 2 * i):
+                sieve[multiple] = False
+    return primes
+
+
+# Candidates that share a factor with this product of small primes are
+# composite. A single gcd() with it rejects most candidates a lot faster than
+# Miller-Rabin testing can.
+SMALL_PRIMES_LIMIT = 1000
+_SMALL_PRIMES_PRODUCT = math.prod(odd_primes_below(SMALL_PRIMES_LIMIT))
+
+
 def gcd(p: int, q: int) -> int:
     """Returns the greatest common divisor of p and q
 
@@ -82,6 +109,9 @@ def miller_rabin_primality_testing(n: int, k: int) -> bool:
     if n < 2:
         return False
 
+    # Use GMP for the modular exponentiations when gmpy2 is installed.
+    n = rsa.common.fast_int(n)
+
     # Decompose (n - 1) to write it as (2 ** r) * d
     # While d is even, divide it by 2 and increase the exponent.
     d = n - 1
@@ -134,6 +164,10 @@ def is_prime(number: int) -> bool:
     if not (number & 1):
         return False
 
+    # Check for small prime factors.
+    if number > SMALL_PRIMES_LIMIT and math.gcd(number, _SMALL_PRIMES_PRODUCT) != 1:
+        return False
+
     # Calculate minimum number of rounds.
     k = get_primality_testing_rounds(number)
 
@@ -186,9 +220,14 @@ def are_relatively_prime(a: int, b: int) -> bool:
 if __name__ == "__main__":
     print("Running doctests 1000x or until failure")
     import doctest
+    import sys
+
+    # Parse the doctests once, and keep their globals between runs.
+    doctests = doctest.DocTestFinder().find(sys.modules[__name__])
+    runner = doctest.DocTestRunner()
 
     for count in range(1000):
-        (failures, tests) = doctest.testmod()
+        failures = sum(runner.run(test, clear_globs=False).failed for test in doctests)
         if failures:
             break
 
@@ -15,7 +15,7 @@
 
 import unittest
 import struct
-from rsa.common import byte_size, bit_size, inverse
+from rsa.common import byte_size, bit_size, extended_gcd, inverse, NotRelativePrimeError
 
 
 class TestByteSize(unittest.TestCase):
@@ -73,6 +73,21 @@ class TestBitSize(unittest.TestCase):
         self.assertRaises(TypeError, bit_size, 0.0)
 
 
+class TestExtendedGcd(unittest.TestCase):
+    def test_values(self):
+        self.assertEqual((1, 9, 1), extended_gcd(5, 11))
+        self.assertEqual((5, 14, 2), extended_gcd(25, 15))
+        self.assertEqual((12, 1, 0), extended_gcd(12, 0))
+
+    def test_negative_coefficients(self):
+        # 1 = -1 * 7 + 2 * 4, with -1 wrapped modulo 4.
+        self.assertEqual((1, 3, 2), extended_gcd(7, 4))
+        # 1 = 2 * 4 - 1 * 7, with -1 wrapped modulo 4.
+        self.assertEqual((1, 2, 3), extended_gcd(4, 7))
+        # 2 = -9 * 240 + 47 * 46, with -9 wrapped modulo 46.
+        self.assertEqual((2, 37, 47), extended_gcd(240, 46))
+
+
 class TestInverse(unittest.TestCase):
     def test_normal(self):
         self.assertEqual(3, inverse(7, 4))
@@ -81,3 +96,14 @@ class TestInverse(unittest.TestCase):
     def test_not_relprime(self):
         self.assertRaises(ValueError, inverse, 4, 8)
         self.assertRaises(ValueError, inverse, 25, 5)
+
+    def test_not_relprime_divider(self):
+        with self.assertRaises(NotRelativePrimeError) as ctx:
+            inverse(25, 15)
+        self.assertEqual(5, ctx.exception.d)
+
+    def test_negative_modulus(self):
+        with self.assertRaises(NotRelativePrimeError) as ctx:
+            inverse(3, -7)
+        self.assertEqual(-1, ctx.exception.d)
+        self.assertRaises(NotRelativePrimeError, inverse, 1, 0)
@@ -2,8 +2,11 @@
 Some tests for the rsa/key.py file.
 """
 
+import shutil
 import unittest
+from unittest import mock
 
+import rsa.common
 import rsa.key
 import rsa.core
 
@@ -36,6 +39,35 @@ class BlindingTest(unittest.TestCase):
         unblinded_2 = pk.unblind(decrypted, unblind_2)
         self.assertEqual(unblinded_2, message)
 
+    def test_blinded_decrypt_returns_int(self):
+        """Internal (possibly gmpy2) integers should not leak out of the key."""
+
+        pk = rsa.key.PrivateKey(3727264081, 65537, 3349121513, 65063, 57287)
+        encrypted = rsa.core.encrypt_int(12345, pk.e, pk.n)
+
+        self.assertIs(int, type(pk.blinded_decrypt(encrypted)))
+        for attr in ("exp1", "exp2", "coef"):
+            self.assertIs(int, type(getattr(pk, attr)))
+
+
+class ItemAccessTest(unittest.TestCase):
+    def test_public_key(self):
+        pub = rsa.key.PublicKey(3727264081, 65537)
+
+        self.assertEqual(3727264081, pub["n"])
+        self.assertEqual(65537, pub["e"])
+        self.assertRaises(KeyError, lambda: pub["blindfac"])
+        self.assertRaises(KeyError, lambda: pub["nonexistent"])
+
+    def test_private_key(self):
+        pk = rsa.key.PrivateKey(3727264081, 65537, 3349121513, 65063, 57287)
+
+        self.assertEqual(3349121513, pk["d"])
+        self.assertEqual(50797, pk["coef"])
+        self.assertEqual([], pk["rs"])
+        self.assertRaises(KeyError, lambda: pk["mutex"])
+        self.assertRaises(KeyError, lambda: pk["nonexistent"])
+
 
 class KeyGenTest(unittest.TestCase):
     def test_custom_exponent(self):
@@ -89,6 +121,55 @@ class KeyGenTest(unittest.TestCase):
         self.assertEqual(rs, [39317, 33107])
 
 
+@unittest.skipUnless(shutil.which("openssl"), "requires the openssl command line tool")
+class OpenSSLKeyGenTest(unittest.TestCase):
+    def test_newkeys(self):
+        pub, priv = rsa.key.newkeys(512, exponent=3, use_openssl=True)
+
+        self.assertEqual(512, rsa.common.bit_size(priv.n))
+        self.assertEqual(priv.n, priv.p * priv.q)
+        self.assertEqual(3, priv.e)
+        self.assertEqual(pub, rsa.key.PublicKey(priv.n, priv.e))
+
+        message = 12345
+        encrypted = rsa.core.encrypt_int(message, pub.e, pub.n)
+        self.assertEqual(message, priv.blinded_decrypt(encrypted))
+
+    def test_fallback_without_openssl(self):
+        with mock.patch("subprocess.run", side_effect=FileNotFoundError("openssl")):
+            pub, priv = rsa.key.newkeys(512, use_openssl=True)
+
+        self.assertEqual(512, rsa.common.bit_size(priv.n))
+
+    def test_small_keys(self):
+        with mock.patch("subprocess.run") as run:
+            rsa.key.newkeys(128, use_openssl=True)
+
+        run.assert_not_called()
+
+
+class EqualityTest(unittest.TestCase):
+    def test_private_key(self):
+        pk = rsa.key.PrivateKey(3727264081, 65537, 3349121513, 65063, 57287)
+
+        self.assertEqual(pk, pk)
+        self.assertEqual(pk, rsa.key.PrivateKey(3727264081, 65537, 3349121513, 65063, 57287))
+        self.assertNotEqual(pk, rsa.key.PrivateKey(3727264081, 3, 3349121513, 65063, 57287))
+        self.assertNotEqual(pk, rsa.key.PrivateKey(3727264081, 65537, 3349121515, 65063, 57287))
+        self.assertNotEqual(pk, rsa.key.PublicKey(3727264081, 65537))
+        self.assertNotEqual(pk, None)
+
+    def test_multiprime_private_key(self):
+        pk = rsa.key.PrivateKey(
+            4253220375837175409, 65537, 3349121513, 64123, 50957, [39317, 33107]
+        )
+        other = rsa.key.PrivateKey(
+            4253220375837175409, 65537, 3349121513, 64123, 50957, [33107, 39317]
+        )
+
+        self.assertNotEqual(pk, other)
+
+
 class HashTest(unittest.TestCase):
     """Test hashing of keys"""
 
@@ -98,3 +179,17 @@ class HashTest(unittest.TestCase):
         # This raises a TypeError when hashing isn't possible.
         hash(priv)
         hash(pub)
+
+    def test_hash_equal_keys(self):
+        pk = rsa.key.PrivateKey(3727264081, 65537, 3349121513, 65063, 57287)
+        other = rsa.key.PrivateKey(3727264081, 65537, 3349121513, 65063, 57287)
+
+        self.assertEqual(hash(pk), hash(other))
+        self.assertEqual(1, len({pk, other}))
+
+    def test_different_modulus(self):
+        pk = rsa.key.PrivateKey(3727264081, 65537, 3349121513, 65063, 57287)
+        other = rsa.key.PrivateKey(3727264083, 65537, 3349121513, 65063, 57287)
+
+        self.assertNotEqual(pk, other)
+        self.assertEqual(2, len({pk, other}))
@@ -21,7 +21,13 @@ import unittest
 import warnings
 from unittest import mock
 
+from pyasn1.codec.der import encoder
+from pyasn1.error import PyAsn1Error
+from pyasn1.type import univ
+
+import rsa.asn1
 import rsa.key
+import rsa.prime
 
 B64PRIV_DER = b"MC4CAQACBQDeKYlRAgMBAAECBQDHn4npAgMA/icCAwDfxwIDANcXAgInbwIDAMZt"
 PRIVATE_DER = base64.standard_b64decode(B64PRIV_DER)
@@ -100,15 +106,12 @@ class DerTest(unittest.TestCase):
         self.assertEqual(key.exp2, 10095)
         self.assertEqual(key.coef, 50797)
 
-    @mock.patch("pyasn1.codec.der.decoder.decode")
+    @mock.patch("rsa.asn1.decode_der")
     def test_load_malformed_private_key(self, der_decode):
         """Test loading malformed private DER keys."""
 
         # Decode returns an invalid exp2 value.
-        der_decode.return_value = (
-            [0, 3727264081, 65537, 3349121513, 65063, 57287, 55063, 0, 50797],
-            0,
-        )
+        der_decode.return_value = [0, 3727264081, 65537, 3349121513, 65063, 57287, 55063, 0, 50797]
 
         with warnings.catch_warnings(record=True) as w:
             # Always print warnings
@@ -156,6 +159,36 @@ class DerTest(unittest.TestCase):
         self.assertIsInstance(der, bytes)
         self.assertEqual(PUBLIC_DER, der)
 
+    def test_unsupported_format(self):
+        """Test loading and saving in an unknown format."""
+
+        key = rsa.key.PublicKey(3727264081, 65537)
+
+        with self.assertRaisesRegex(ValueError, "try one of DER, PEM"):
+            key.save_pkcs1("XML")
+        with self.assertRaisesRegex(ValueError, "try one of DER, PEM"):
+            rsa.key.PublicKey.load_pkcs1(PUBLIC_DER, "der")
+
+    @mock.patch("rsa.asn1._fasder_decode_der", side_effect=PyAsn1Error("rejected"))
+    def test_fasder_fallback(self, fasder_decode):
+        """Test falling back to pyasn1 when pyasn1-fasder rejects a key."""
+
+        self.assertEqual(
+            rsa.key.PublicKey(3727264081, 65537),
+            rsa.key.PublicKey.load_pkcs1(PUBLIC_DER, "DER"),
+        )
+        self.assertEqual(
+            rsa.key.PrivateKey(3727264081, 65537, 3349121513, 65063, 57287),
+            rsa.key.PrivateKey.load_pkcs1(PRIVATE_DER, "DER"),
+        )
+        self.assertEqual(
+            rsa.key.PrivateKey(
+                4253220375837175409, 65537, 3349121513, 64123, 50957, [39317, 33107]
+            ),
+            rsa.key.PrivateKey.load_pkcs1(MP_PRIVATE_DER, "DER"),
+        )
+        self.assertEqual(3, fasder_decode.call_count)
+
 
 class PemTest(unittest.TestCase):
     """Test saving and loading PEM keys."""
@@ -288,6 +321,26 @@ class MultiprimeDerTest(unittest.TestCase):
         self.assertEqual(key.ds, [27369, 19235])
         self.assertEqual(key.ts, [10773, 10974])
 
+    def test_load_many_primes(self):
+        """Test that loading keys with many primes keeps the schema cache bounded."""
+
+        primes = rsa.prime.odd_primes_below(2000)
+        rsa.asn1.asn_priv_key_type.cache_clear()
+
+        for nr_other_primes in range(1, 3 * rsa.asn1.MAX_OTHER_PRIMES):
+            fields = univ.SequenceOf(componentType=univ.Integer())
+            fields.extend([0] + primes[: 8 + 3 * nr_other_primes])
+            der = encoder.encode(fields)
+
+            # The exponents and coefficients are not valid for these primes.
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", UserWarning)
+                key = rsa.key.PrivateKey.load_pkcs1(der, "DER")
+            self.assertEqual(nr_other_primes, len(key.rs))
+
+        cache_info = rsa.asn1.asn_priv_key_type.cache_info()
+        self.assertLessEqual(cache_info.currsize, rsa.asn1.MAX_OTHER_PRIMES)
+
     def test_save_multiprime_private_key(self):
         """Test saving private DER keys."""
 
@@ -5,6 +5,7 @@ import unittest
 import rsa.prime
 import rsa.parallel
 import rsa.common
+import rsa.key
 
 
 class ParallelTest(unittest.TestCase):
@@ -18,3 +19,30 @@ class ParallelTest(unittest.TestCase):
         self.assertFalse(rsa.prime.is_prime(p + 1))
 
         self.assertEqual(1024, rsa.common.bit_size(p))
+
+    def test_prime_pool(self):
+        with rsa.parallel.PrimePool(3) as pool:
+            p = pool.getprime(1024)
+            q = pool.getprime(512)
+
+        self.assertTrue(rsa.prime.is_prime(p))
+        self.assertTrue(rsa.prime.is_prime(q))
+        self.assertEqual(1024, rsa.common.bit_size(p))
+        self.assertEqual(512, rsa.common.bit_size(q))
+
+    def test_newkeys_poolsize(self):
+        (pub, priv) = rsa.key.newkeys(512, poolsize=3)
+
+        self.assertEqual(512, rsa.common.bit_size(pub.n))
+        self.assertEqual(priv.n, priv.p * priv.q)
+
+    def test_newkeys_shared_pool(self):
+        with rsa.parallel.PrimePool(3) as pool:
+            keys = [rsa.key.newkeys(256, prime_pool=pool) for _ in range(3)]
+            (_, multiprime) = rsa.key.newkeys(256, nprimes=3, prime_pool=pool)
+
+        for (pub, priv) in keys:
+            self.assertEqual(256, rsa.common.bit_size(pub.n))
+            self.assertEqual(priv.n, priv.p * priv.q)
+        self.assertEqual(3, len({priv.p for (_, priv) in keys}))
+        self.assertEqual(multiprime.n, multiprime.p * multiprime.q * multiprime.rs[0])
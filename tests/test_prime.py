@@ -42,6 +42,18 @@ class PrimeTest(unittest.TestCase):
         self.assertTrue(rsa.prime.is_prime(982451653))
         self.assertFalse(rsa.prime.is_prime(982451653 * 961748941))
 
+    def test_is_prime_small_factors(self):
+        """Test numbers around the small primes used for trial division."""
+
+        small_primes = rsa.prime.odd_primes_below(rsa.prime.SMALL_PRIMES_LIMIT)
+        self.assertEqual(997, small_primes[-1])
+
+        self.assertTrue(rsa.prime.is_prime(1009))
+        self.assertFalse(rsa.prime.is_prime(997 * 997))
+        self.assertFalse(rsa.prime.is_prime(982451653 * 3))
+        self.assertFalse(rsa.prime.is_prime(982451653 * 997))
+        self.assertTrue(rsa.prime.is_prime(2**127 - 1))
+
     def test_miller_rabin_primality_testing(self):
         """Uses monkeypatching to ensure certain random numbers.
 